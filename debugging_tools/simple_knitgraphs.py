@@ -21,11 +21,13 @@ def stockinette(width: int = 4, height: int = 4) -> Knit_Graph:
     prior_row = first_row
     for _ in range(1, height):
         next_row = []
+        stitches = []
         for parent_id in reversed(prior_row):
             child_id, child = yarn.add_loop_to_end()
             next_row.append(child_id)
             knitGraph.add_loop(child)
-            knitGraph.connect_loops(parent_id, child_id)
+            stitches.append((parent_id, child_id))
+        knitGraph.connect_loops_bulk(stitches)  # connect the whole course at once
         prior_row = next_row
 
     return knitGraph
@@ -1,6 +1,6 @@
 """The graph structure used to represent knitted objects"""
 from enum import Enum
-from typing import Dict, Optional, List, Tuple, Union
+from typing import Dict, Optional, List, Tuple, Union, Iterable
 
 import networkx
 
@@ -12,15 +12,17 @@ class Pull_Direction(Enum):
     """An enumerator of the two pull directions of a loop"""
     BtF = "BtF"
     FtB = "FtB"
+    _opposite: "Pull_Direction"
 
     def opposite(self):
         """
         :return: returns the opposite pull direction of self
         """
-        if self is Pull_Direction.BtF:
-            return Pull_Direction.FtB
-        else:
-            return Pull_Direction.BtF
+        return self._opposite
+
+
+Pull_Direction.BtF._opposite = Pull_Direction.FtB
+Pull_Direction.FtB._opposite = Pull_Direction.BtF
 
 
 class Knit_Graph:
@@ -77,6 +79,16 @@ class Knit_Graph:
         # "pull_direction", "depth", and "parent_offset"
         # add the parent loop to the child's parent loop stack
 
+    def connect_loops_bulk(self, stitches: Iterable[tuple]):
+        """
+        Creates a batch of stitch-edges, as though connect_loops was called on each stitch in order
+        :param stitches: tuples of the connect_loops parameters in the same order:
+            (parent_loop_id, child_loop_id, pull_direction, stack_position, depth, parent_offset).
+            Trailing parameters may be left off to use the connect_loops defaults
+        """
+        for stitch in stitches:
+            self.connect_loops(*stitch)
+
     def get_courses(self) -> Tuple[Dict[int, float], Dict[float, List[int]]]:
         """
         Course information will be used to generate instruction for knitting machines and
@@ -100,16 +112,18 @@ class Knit_Graph:
         :return: true if the loop_id of item or the loop is in the graph
         """
         if type(item) is int:
-            return self.graph.has_node(item)
+            return item in self.loops
         elif isinstance(item, Loop):
-            return self.graph.has_node(item.loop_id)
+            return item.loop_id in self.loops
+        else:
+            return False
 
     def __getitem__(self, item: int) -> Loop:
         """
         :param item: the loop_id being checked for in the graph
         :return: the Loop in the graph with the matching id
         """
-        if item not in self:
+        loop = self.loops.get(item)
+        if loop is None:
             raise AttributeError
-        else:
-            return self.graph.nodes[item]["loop"]
+        return loop
@@ -52,7 +52,7 @@ class Loop:
         :return: the id of the loop that comes before this in the knitgraph
         """
         prior_id = self.loop_id - 1
-        if knitGraph.graph.has_node(prior_id):
+        if prior_id in knitGraph:
             return prior_id
         else:
             return None
@@ -63,7 +63,7 @@ class Loop:
         :return: the id of the loop that comes after this in the knitgraph
         """
         next_id = self.loop_id + 1
-        if knitGraph.graph.has_node(next_id):
+        if next_id in knitGraph:
             return next_id
         else:
             return None
@@ -1,6 +1,6 @@
 """The graph structure used to represent knitted objects"""
 from enum import Enum
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple, Iterable
 
 import networkx
 
@@ -13,15 +13,17 @@ class Pull_Direction(Enum):
     """An enumerator of the two pull directions of a loop"""
     BtF = "BtF"
     FtB = "FtB"
+    _opposite: "Pull_Direction"
 
     def opposite(self):
         """
         :return: returns the opposite pull direction of self
         """
-        if self is Pull_Direction.BtF:
-            return Pull_Direction.FtB
-        else:
-            return Pull_Direction.BtF
+        return self._opposite
+
+
+Pull_Direction.BtF._opposite = Pull_Direction.FtB
+Pull_Direction.FtB._opposite = Pull_Direction.BtF
 
 
 class Knit_Graph:
@@ -32,7 +34,8 @@ class Knit_Graph:
     Attributes
     ----------
     graph : networkx.DiGraph
-        the directed-graph structure of loops pulled through other loops
+        the directed-graph structure of loops pulled through other loops.
+        Modify it through add_loop and connect_loops so that the cached courses are cleared
     loops: Dict[int, Loop]
         A map of each unique loop id to its loop
     yarns: Dict[str, Yarn]
@@ -44,16 +47,67 @@ class Knit_Graph:
         self.loops: Dict[int, Loop] = {}
         self.last_loop_id: int = -1
         self.yarns: Dict[str, Yarn] = {}
+        # loop ids in order of loop_id, only re-sorted when a loop is added out of order
+        self._loop_order: List[int] = []
+        self._loop_order_is_sorted: bool = True
+        self._courses_cache: Optional[Tuple[Dict[int, int], Dict[int, List[int]]]] = None
+        self._number_of_edges_cache: Optional[int] = None
 
     def add_loop(self, loop: Loop):
         """
         :param loop: the loop to be added in as a node in the graph
         """
         self.graph.add_node(loop.loop_id, loop=loop)
-        assert loop.yarn_id in self.yarns, f"No yarn {loop.yarn_id} in this graph"
-        if loop not in self.yarns[loop.yarn_id]:  # make sure the loop is on the yarn specified
-            self.yarns[loop.yarn_id].add_loop_to_end(loop_id=None, loop=loop)
+        self._place_on_yarn(loop)
+        self._record_loop_order(loop.loop_id)
         self.loops[loop.loop_id] = loop
+        self._courses_cache = None
+
+    def add_loops(self, loops: Iterable[Loop]):
+        """
+        Adds a batch of loops as nodes in the graph, as though add_loop was called on each loop in order
+        :param loops: the loops to be added in the order they were created
+        """
+        loops = [*loops]
+        for loop in loops:  # check every yarn before changing anything
+            assert loop.yarn_id in self.yarns, f"No yarn {loop.yarn_id} in this graph"
+        for loop in loops:
+            self._place_on_yarn(loop)
+        self.graph.add_nodes_from((loop.loop_id, {"loop": loop}) for loop in loops)
+        for loop in loops:
+            self._record_loop_order(loop.loop_id)
+            self.loops[loop.loop_id] = loop
+        self._courses_cache = None
+
+    def _record_loop_order(self, loop_id: int):
+        """
+        Appends a new loop to the loop order. Must be called before the loop is added to the loops dictionary
+        :param loop_id: the id of the loop being added to the graph
+        """
+        if loop_id in self.loops:  # a loop that is added again keeps its place
+            return
+        if len(self._loop_order) > 0 and loop_id < self._loop_order[-1]:
+            self._loop_order_is_sorted = False
+        self._loop_order.append(loop_id)
+
+    def _sorted_loop_order(self) -> List[int]:
+        """
+        Loop ids represent the order loops were created in, so every parent is ordered before its children
+        :return: the ids of the loops in the graph in order of loop_id
+        """
+        if not self._loop_order_is_sorted:
+            self._loop_order.sort()
+            self._loop_order_is_sorted = True
+        return self._loop_order
+
+    def _place_on_yarn(self, loop: Loop):
+        """
+        :param loop: the loop to add to the end of its specified yarn if it is not already on it
+        """
+        assert loop.yarn_id in self.yarns, f"No yarn {loop.yarn_id} in this graph"
+        yarn = self.yarns[loop.yarn_id]
+        if loop.loop_id not in yarn:  # make sure the loop is on the yarn specified
+            yarn.add_loop_to_end(loop_id=None, loop=loop)
 
     def add_yarn(self, yarn: Yarn):
         """
@@ -73,13 +127,59 @@ class Knit_Graph:
         :param pull_direction: the direction the child is pulled through the parent
         :param stack_position: The position to insert the parent into, by default add on top of the stack
         """
-        assert parent_loop_id in self, f"parent loop {parent_loop_id} is not in this graph"
-        assert child_loop_id in self, f"child loop {child_loop_id} is not in this graph"
+        self._validate_stitch(parent_loop_id, child_loop_id)
         self.graph.add_edge(parent_loop_id, child_loop_id, pull_direction=pull_direction, depth=depth, parent_offset=parent_offset)
         # TODO: Check that the order of edges (parent -> child) is correct in your code
         child_loop = self[child_loop_id]
         parent_loop = self[parent_loop_id]
         child_loop.add_parent_loop(parent_loop, stack_position)
+        self._courses_cache = None
+        self._number_of_edges_cache = None
+
+    def connect_loops_bulk(self, stitches: Iterable[tuple]):
+        """
+        Creates a batch of stitch-edges, as though connect_loops was called on each stitch in order
+        :param stitches: tuples of the connect_loops parameters in the same order:
+            (parent_loop_id, child_loop_id, pull_direction, stack_position, depth, parent_offset).
+            Trailing parameters may be left off to use the connect_loops defaults
+        """
+        stitches = [*stitches]
+        for stitch in stitches:  # validate the whole batch before changing anything
+            assert 2 <= len(stitch) <= 6, f"stitch {stitch} must have 2 to 6 connect_loops parameters"
+            self._validate_stitch(stitch[0], stitch[1])
+        defaults = (Pull_Direction.BtF, None, 0, 0)
+        stitches = [(*stitch, *defaults[len(stitch) - 2:]) for stitch in stitches]
+        edges = [(parent_loop_id, child_loop_id,
+                  {"pull_direction": pull_direction, "depth": depth, "parent_offset": parent_offset})
+                 for parent_loop_id, child_loop_id, pull_direction, _, depth, parent_offset in stitches]
+        self.graph.add_edges_from(edges)
+        for parent_loop_id, child_loop_id, _, stack_position, _, _ in stitches:
+            self[child_loop_id].add_parent_loop(self[parent_loop_id], stack_position)
+        self._courses_cache = None
+        self._number_of_edges_cache = None
+
+    def _validate_stitch(self, parent_loop_id: int, child_loop_id: int):
+        """
+        :param parent_loop_id: the id of the parent loop to connect to the child
+        :param child_loop_id: the id of the child loop to connect to the parent
+        """
+        assert parent_loop_id in self, f"parent loop {parent_loop_id} is not in this graph"
+        assert child_loop_id in self, f"child loop {child_loop_id} is not in this graph"
+
+    def predecessors(self, loop_id: int) -> List[int]:
+        """
+        :param loop_id: the id of the child loop
+        :return: the ids of the parent loops of the child loop in the order they were connected
+        """
+        return [*self.graph._pred[loop_id]]
+
+    def number_of_edges(self) -> int:
+        """
+        :return: the number of stitch edges in the graph, cached until a stitch is added
+        """
+        if self._number_of_edges_cache is None:
+            self._number_of_edges_cache = self.graph.number_of_edges()
+        return self._number_of_edges_cache
 
     def get_courses(self) -> Tuple[Dict[int, int], Dict[int, List[int]]]:
         """
@@ -87,59 +187,39 @@ class Knit_Graph:
         a dictionary or course ids to the loops on that course in the order of creation
         The first set of loops in the graph is on course 0.
         A course change occurs when a loop has a parent loop that is in the last course.
+        Loops are visited in order of loop_id, independent of the order they were added to the graph.
+        The courses are cached until a loop or stitch is added to the graph. Callers receive copies of the cache.
         """
+        if self._courses_cache is None:
+            self._courses_cache = self._find_courses()
+        loop_ids_to_course, course_to_loop_ids = self._courses_cache
+        return dict(loop_ids_to_course), {course: [*loop_ids] for course, loop_ids in course_to_loop_ids.items()}
+
+    def _find_courses(self) -> Tuple[Dict[int, int], Dict[int, List[int]]]:
+        """
+        :return: the loop_ids to course and course to loop_ids dictionaries described in get_courses
+        """
+        pred = self.graph._pred
         loop_ids_to_course = {}
         course_to_loop_ids = {}
         current_course_set = set()
         current_course = []
         course = 0
-        for loop_id in self.graph.nodes:
-            no_parents_in_course = True
-            for parent_id in self.graph.predecessors(loop_id):
-                if parent_id in current_course_set:
-                    no_parents_in_course = False
+        # Topological waves are not used because yarn-overs have no parents but are not on the first course
+        for loop_id in self._sorted_loop_order():
+            for parent_id in pred[loop_id]:
+                if parent_id in current_course_set:  # a parent on this course starts the next course
+                    course_to_loop_ids[course] = current_course
+                    current_course = []
+                    current_course_set = set()
+                    course += 1
                     break
-            if no_parents_in_course:
-                current_course_set.add(loop_id)
-                current_course.append(loop_id)
-            else:
-                course_to_loop_ids[course] = current_course
-                current_course = [loop_id]
-                current_course_set = {loop_id}
-                course += 1
+            current_course_set.add(loop_id)
+            current_course.append(loop_id)
             loop_ids_to_course[loop_id] = course
         course_to_loop_ids[course] = current_course
         return loop_ids_to_course, course_to_loop_ids
 
-    # @deprecated("Deprecated because this only works in rows, but not round construction")
-    def deprecated_get_course(self) -> Tuple[Dict[int, int], Dict[int, List[int]]]:
-        """
-        :return: A dictionary of loop_ids to the course they are on,
-        a dictionary or course ids to the loops on that course in the order of creation
-        The first set of loops in the graph is on course 0.
-        A course change occurs when a loop has a parent loop that is in the last course.
-        """
-        loop_ids_to_course = {}
-        for loop_id in self.graph.nodes:
-            loop = self.loops[loop_id]
-            prior_id = loop.prior_loop_id(self)
-            if prior_id is None:  # the first loop in the graph
-                loop_ids_to_course[loop_id] = 0
-            elif self.graph.has_edge(prior_id, loop_id):  # stitch between the two creates a course change
-                loop_ids_to_course[loop_id] = loop_ids_to_course[prior_id] + 1
-            else:
-                loop_ids_to_course[loop_id] = loop_ids_to_course[prior_id]
-
-        course_to_loop_ids = {}
-        for loop_id, course in loop_ids_to_course.items():
-            if course not in course_to_loop_ids:
-                course_to_loop_ids[course] = []
-            course_to_loop_ids[course].append(loop_id)
-
-        for course in course_to_loop_ids:
-            course_to_loop_ids[course].sort()
-        return loop_ids_to_course, course_to_loop_ids
-
     def get_carriers(self) -> List[Yarn_Carrier]:
         """
         :return: A list of yarn carriers that hold the yarns involved in this graph
@@ -152,9 +232,9 @@ class Knit_Graph:
         :return: true if the loop_id of item or the loop is in the graph
         """
         if type(item) is int:
-            return self.graph.has_node(item)
+            return item in self.loops
         elif isinstance(item, Loop):
-            return self.graph.has_node(item.loop_id)
+            return item.loop_id in self.loops
         else:
             return False
 
@@ -163,7 +243,7 @@ class Knit_Graph:
         :param item: the loop_id being checked for in the graph
         :return: the Loop in the graph with the matching id
         """
-        if item not in self:
+        loop = self.loops.get(item)
+        if loop is None:
             raise AttributeError
-        else:
-            return self.graph.nodes[item]["loop"]
+        return loop
@@ -11,22 +11,20 @@ class Pass_Direction(Enum):
     """
     Right_to_Left = "-"
     Left_to_Right = "+"
+    _opposite: "Pass_Direction"
 
     def opposite(self):
         """
         :return: the opposite pass direction of this
         """
-        if self.value == Pass_Direction.Right_to_Left.value:
-            return Pass_Direction.Left_to_Right
-        else:
-            return Pass_Direction.Right_to_Left
+        return self._opposite
 
     def next_needle_position(self, needle_pos: int):
         """
         :param needle_pos: the needle that we are looking for the next neighbor of
         :return: the next needle position in the pass direction
         """
-        if self.value == Pass_Direction.Right_to_Left.value:
+        if self is Pass_Direction.Right_to_Left:
             return needle_pos - 1
         else:
             return needle_pos + 1
@@ -36,7 +34,7 @@ class Pass_Direction(Enum):
         :param needle_pos: the needle that we are looking for the prior neighbor of
         :return: the prior needle position in the pass direction
         """
-        if self.value == Pass_Direction.Right_to_Left.value:
+        if self is Pass_Direction.Right_to_Left:
             return needle_pos + 1
         else:
             return needle_pos - 1
@@ -45,6 +43,10 @@ class Pass_Direction(Enum):
         return self.value
 
 
+Pass_Direction.Right_to_Left._opposite = Pass_Direction.Left_to_Right
+Pass_Direction.Left_to_Right._opposite = Pass_Direction.Right_to_Left
+
+
 class Needle:
     """
     A Simple class structure for keeping track of needle locations
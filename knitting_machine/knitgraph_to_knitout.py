@@ -234,13 +234,12 @@ class Knitout_Generator:
         """
         first_course_loops = self._courses_to_loop_ids[self._sorted_courses[0]]
         carrier_set = [self._carrier]
-        even_tucks_data: Dict[Needle, Tuple[Optional[int], None]] = {}
-        odd_tucks_data: Dict[Needle, Tuple[Optional[int], None]] = {}
-        for needle_pos in range(0, len(first_course_loops)):
-            if needle_pos % 2 == 0:
-                even_tucks_data[Needle(True, needle_pos)] = -1, None  # note, fake loop_id
-            else:
-                odd_tucks_data[Needle(True, needle_pos)] = -1, None
+        needle_count = len(first_course_loops)
+        # note, fake loop_ids
+        even_tucks_data: Dict[Needle, Tuple[Optional[int], None]] = \
+            {Needle(True, needle_pos): (-1, None) for needle_pos in range(0, needle_count, 2)}
+        odd_tucks_data: Dict[Needle, Tuple[Optional[int], None]] = \
+            {Needle(True, needle_pos): (-1, None) for needle_pos in range(1, needle_count, 2)}
 
         even_pass = Carriage_Pass(Instruction_Type.Tuck, Pass_Direction.Right_to_Left, even_tucks_data,
                                   carrier_set, self._machine_state)
@@ -249,11 +248,10 @@ class Knitout_Generator:
                                  carrier_set, self._machine_state)
         self._add_carriage_pass(odd_pass, "odd cast-on")
 
-        reverse_knits: Dict[Needle, Tuple[int, None]] = {}
-        first_loops: Dict[Needle, Tuple[int, None]] = {}
-        for needle_pos, loop_id in enumerate(first_course_loops):
-            reverse_knits[Needle(True, needle_pos)] = -1, None  # note, fake loop_id
-            first_loops[Needle(True, needle_pos)] = loop_id, None
+        reverse_knits: Dict[Needle, Tuple[int, None]] = \
+            {Needle(True, needle_pos): (-1, None) for needle_pos in range(0, needle_count)}  # note, fake loop_id
+        first_loops: Dict[Needle, Tuple[int, None]] = \
+            {Needle(True, needle_pos): (loop_id, None) for needle_pos, loop_id in enumerate(first_course_loops)}
 
         carriage_pass = Carriage_Pass(Instruction_Type.Knit, Pass_Direction.Right_to_Left,
                                       reverse_knits, carrier_set, self._machine_state)
@@ -305,4 +303,4 @@ class Knitout_Generator:
         if generate_instructions:
             self.generate_instructions()
         with open(filename, "w") as file:
-            file.writelines(self._instructions)
+            file.write("".join(self._instructions))
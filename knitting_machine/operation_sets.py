@@ -21,8 +21,7 @@ class Instruction_Type(Enum):
         (all left to right or all right to left),
         in a sorted order
         """
-        return self.value in [Instruction_Type.Knit.value, Instruction_Type.Split.value,
-                              Instruction_Type.Tuck.value, Instruction_Type.Miss.value]
+        return self in (Instruction_Type.Knit, Instruction_Type.Split, Instruction_Type.Tuck, Instruction_Type.Miss)
 
     def direction_must_be_Left_to_Right(self) -> bool:
         """
@@ -34,7 +33,7 @@ class Instruction_Type(Enum):
         """
         :return: True
         """
-        return self.value == Instruction_Type.Xfer.value
+        return self is Instruction_Type.Xfer
 
 
 class Carriage_Pass:
@@ -75,7 +74,7 @@ class Carriage_Pass:
             elif self.instruction_type.direction_must_be_consistent():
                 self._direction = self.machine_state.last_carriage_direction.opposite()  # switch from last pass
         elif self.instruction_type.direction_must_be_Left_to_Right():
-            assert self.direction.value == Pass_Direction.Left_to_Right.value, "Can only Drop on + (left to right) pass"
+            assert self.direction is Pass_Direction.Left_to_Right, "Can only Drop on + (left to right) pass"
 
     @property
     def instruction_type(self) -> Instruction_Type:
@@ -99,12 +98,10 @@ class Carriage_Pass:
         return self._carrier_set
 
     def _sorted_needles(self) -> List[Needle]:
-        needles = [*self.needles_to_instruction_parameters]
-        sorted_left_to_right = sorted(needles)
+        sorted_needles = sorted(self.needles_to_instruction_parameters)
         if self.direction is Pass_Direction.Right_to_Left:
-            return [*reversed(sorted_left_to_right)]
-        else:
-            return sorted_left_to_right
+            sorted_needles.reverse()  # right to left passes visit needles in descending order
+        return sorted_needles
 
     def _write_instruction(self, needle: Needle, loop_id: Optional[int],
                            second_needle: Optional[Needle], comment="") -> str:
@@ -115,23 +112,24 @@ class Carriage_Pass:
         :param comment: Any specific comments to be included with this instruction
         :return: The string for the line of code executing the instruction
         """
-        if self.instruction_type.value == Instruction_Type.Knit.value:
+        instruction_type = self.instruction_type
+        if instruction_type is Instruction_Type.Knit:
             assert loop_id is not None, "Cannot knit null loop"
             return knit(self.machine_state, self.direction, needle, self.carrier_set, loop_id, comment=comment)
-        elif self.instruction_type.value == Instruction_Type.Tuck.value:
+        elif instruction_type is Instruction_Type.Tuck:
             assert loop_id is not None, "Cannot tuck null loop"
             return tuck(self.machine_state, self.direction, needle, self.carrier_set, loop_id, comment=comment)
-        elif self.instruction_type.value == Instruction_Type.Split.value:
+        elif instruction_type is Instruction_Type.Split:
             assert loop_id is not None, "Cannot split null loop"
             assert second_needle is not None, "Two needles needed to split"
             return split(self.machine_state, self.direction, needle, second_needle, self.carrier_set, loop_id,
                          comment=comment)
-        elif self.instruction_type.value == Instruction_Type.Drop.value:
+        elif instruction_type is Instruction_Type.Drop:
             return drop(self.machine_state, needle, comment=comment)
-        elif self.instruction_type.value == Instruction_Type.Xfer.value:
+        elif instruction_type is Instruction_Type.Xfer:
             assert second_needle is not None, "Two needles needed to split"
             return xfer(self.machine_state, needle, second_needle, comment=comment)
-        elif self.instruction_type.value == Instruction_Type.Miss.value:
+        elif instruction_type is Instruction_Type.Miss:
             return miss(self.direction, needle, self.carrier_set, comment=comment)
         else:
             assert False, "The instruction was not recognized"
@@ -0,0 +1,129 @@
+"""Tests of the batch methods and course caching in the reference Knit_Graph"""
+from types import SimpleNamespace
+
+import pytest
+
+from knit_graphs.Loop import Loop as Template_Loop  # the Loop class that the reference Knit_Graph checks items against
+from knitgraph_graphs_answer.Knit_Graph import Knit_Graph, Pull_Direction
+from knitgraph_graphs_answer.Loop import Loop
+from knitgraph_graphs_answer.Yarn import Yarn
+
+
+def _knit_graph_with_loops(loop_ids) -> Knit_Graph:
+    """
+    :param loop_ids: the ids of the loops to put on the yarn, in the order they are added
+    :return: a knit graph holding one yarn and a loop for each loop_id
+    """
+    knitGraph = Knit_Graph()
+    yarn = Yarn("yarn", knitGraph)
+    knitGraph.add_yarn(yarn)
+    loops = []
+    for loop_id in loop_ids:
+        _, loop = yarn.add_loop_to_end(loop_id=loop_id, loop=Loop(loop_id, yarn.yarn_id))
+        loops.append(loop)
+    knitGraph.add_loops(loops)
+    return knitGraph
+
+
+def test_add_loops():
+    knitGraph = _knit_graph_with_loops(range(4))
+    assert [*knitGraph.loops] == [0, 1, 2, 3]
+    assert [*knitGraph.graph.nodes] == [0, 1, 2, 3]
+    assert all(knitGraph.graph.nodes[loop_id]["loop"] is knitGraph[loop_id] for loop_id in range(4))
+
+
+def test_add_loops_missing_yarn():
+    knitGraph = _knit_graph_with_loops(range(2))
+    _, loop = knitGraph.yarns["yarn"].add_loop_to_end(loop_id=2, loop=Loop(2, "yarn"))
+    with pytest.raises(AssertionError, match="No yarn nope"):
+        knitGraph.add_loops([loop, Loop(3, "nope")])
+    assert [*knitGraph.graph.nodes] == [0, 1]
+    assert [*knitGraph.loops] == [0, 1]
+
+
+def test_connect_loops_bulk_defaults():
+    knitGraph = _knit_graph_with_loops(range(4))
+    knitGraph.connect_loops_bulk([(0, 2), (1, 3, Pull_Direction.FtB, None, 1, -1)])
+    assert knitGraph.graph.edges[0, 2] == {"pull_direction": Pull_Direction.BtF, "depth": 0, "parent_offset": 0}
+    assert knitGraph.graph.edges[1, 3] == {"pull_direction": Pull_Direction.FtB, "depth": 1, "parent_offset": -1}
+    assert knitGraph[2].parent_loops == [knitGraph[0]]
+
+
+def test_connect_loops_bulk_stack_position():
+    knitGraph = _knit_graph_with_loops(range(3))
+    knitGraph.connect_loops_bulk([(0, 2), (1, 2, Pull_Direction.BtF, 0)])
+    assert knitGraph[2].parent_loops == [knitGraph[1], knitGraph[0]]
+    assert knitGraph.predecessors(2) == [0, 1]
+
+
+def test_connect_loops_bulk_invalid_batch():
+    knitGraph = _knit_graph_with_loops(range(3))
+    with pytest.raises(AssertionError, match="child loop 5"):
+        knitGraph.connect_loops_bulk([(0, 2), (1, 5)])
+    assert knitGraph.graph.number_of_edges() == 0
+    assert knitGraph[2].parent_loops == []
+
+
+def test_connect_loops_bulk_malformed_stitch():
+    knitGraph = _knit_graph_with_loops(range(4))
+    for malformed_stitch in [(1,), (1, 3, Pull_Direction.BtF, None, 0, 0, 9)]:
+        with pytest.raises(AssertionError, match="2 to 6"):
+            knitGraph.connect_loops_bulk([(0, 2), malformed_stitch])
+        assert knitGraph.graph.number_of_edges() == 0
+        assert knitGraph[2].parent_loops == []
+
+
+def test_predecessors():
+    knitGraph = _knit_graph_with_loops(range(4))
+    knitGraph.connect_loops(1, 3)
+    knitGraph.connect_loops(0, 3)
+    assert knitGraph.predecessors(3) == [1, 0]
+    assert knitGraph.predecessors(0) == []
+
+
+def test_get_courses_cache_is_cleared():
+    knitGraph = _knit_graph_with_loops(range(4))
+    knitGraph.connect_loops(0, 2)
+    assert knitGraph.get_courses() == ({0: 0, 1: 0, 2: 1, 3: 1}, {0: [0, 1], 1: [2, 3]})
+    knitGraph.connect_loops(2, 3)
+    assert knitGraph.get_courses() == ({0: 0, 1: 0, 2: 1, 3: 2}, {0: [0, 1], 1: [2], 2: [3]})
+
+
+def test_number_of_edges_cache_is_cleared():
+    knitGraph = _knit_graph_with_loops(range(4))
+    assert knitGraph.number_of_edges() == 0
+    knitGraph.connect_loops(0, 2)
+    assert knitGraph.number_of_edges() == 1
+    knitGraph.connect_loops_bulk([(1, 3), (0, 3)])
+    assert knitGraph.number_of_edges() == 3
+
+
+def test_get_courses_returns_copies():
+    knitGraph = _knit_graph_with_loops(range(4))
+    knitGraph.connect_loops(0, 2)
+    loop_ids_to_course, course_to_loop_ids = knitGraph.get_courses()
+    loop_ids_to_course[0] = 5
+    course_to_loop_ids[0].append(3)
+    assert knitGraph.get_courses() == ({0: 0, 1: 0, 2: 1, 3: 1}, {0: [0, 1], 1: [2, 3]})
+
+
+def test_get_courses_out_of_order():
+    knitGraph = _knit_graph_with_loops([2, 0, 3, 1])
+    knitGraph.connect_loops(0, 2)
+    assert knitGraph.get_courses() == ({0: 0, 1: 0, 2: 1, 3: 1}, {0: [0, 1], 1: [2, 3]})
+    yarn = knitGraph.yarns["yarn"]
+    for loop_id in [5, 4]:
+        _, loop = yarn.add_loop_to_end(loop_id=loop_id, loop=Loop(loop_id, yarn.yarn_id))
+        knitGraph.add_loop(loop)
+    knitGraph.connect_loops(2, 4)
+    assert knitGraph.get_courses() == ({0: 0, 1: 0, 2: 1, 3: 1, 4: 2, 5: 2}, {0: [0, 1], 1: [2, 3], 2: [4, 5]})
+
+
+def test_contains():
+    knitGraph = _knit_graph_with_loops(range(2))
+    assert 1 in knitGraph
+    assert 2 not in knitGraph
+    assert Template_Loop(1, "yarn") in knitGraph
+    assert Template_Loop(2, "yarn") not in knitGraph
+    assert True not in knitGraph
+    assert SimpleNamespace(loop_id=1) not in knitGraph